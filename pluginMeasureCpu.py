@@ -48,24 +48,9 @@ class TaskMeasureCPU(PluginTask):
     def __init__(self, ts: TestSettings, node_name: str, tenant: bool):
         super().__init__(ts, 0, node_name, tenant)
 
-        self.in_file_template = "./manifests/tools-pod.yaml.j2"
-        self.out_file_yaml = (
-            f"./manifests/yamls/tools-pod-{self.node_name}-measure-cpu.yaml"
-        )
-        self.pod_name = f"tools-pod-{self.node_name}-measure-cpu"
+        self.init_tools_pod()
         self.node_name = node_name
 
-    def get_template_args(self) -> dict[str, str | list[str]]:
-        return {
-            **super().get_template_args(),
-            "pod_name": self.pod_name,
-            "test_image": tftbase.get_tft_test_image(),
-        }
-
-    def initialize(self) -> None:
-        super().initialize()
-        self.render_file("Server Pod Yaml")
-
     def _create_task_operation(self) -> TaskOperation:
         def _thread_action() -> BaseOutput:
 
@@ -1,4 +1,5 @@
 import logging
+import re
 import typing
 
 from typing import Optional
@@ -23,49 +24,32 @@ logger = logging.getLogger("tft." + __name__)
 VF_REP_TRAFFIC_THRESHOLD = 1000
 
 
-def ethtool_stat_parse(output: str) -> dict[str, str]:
-    result = {}
-    for line in output.splitlines():
-        try:
-            key, val = line.split(":", 2)
-        except Exception:
-            continue
-        if val == "" and " " in key:
-            # This is a section heading.
-            continue
-        result[key.strip()] = val.strip()
+_ETHTOOL_PACKETS_RE = re.compile(
+    r"^[ \t]*((rx|tx)_(?:packets|queue_[^:\n]*_xdp_packets))[ \t]*:[ \t]*([0-9]+)[ \t\r]*$",
+    re.MULTILINE,
+)
+
+
+def ethtool_stat_parse_packets(output: str) -> dict[str, int]:
+    # Get the "rx" and "tx" packet counts from the "ethtool -S" output. If
+    # there is a "<type>_packets" counter, that is used. Otherwise, the
+    # "<type>_queue_*_xdp_packets" counters are summed up. A type without any
+    # counter is missing from the result. Only lines with a plain decimal
+    # value are considered, all other lines are ignored.
+    direct: dict[str, int] = {}
+    queues: dict[str, dict[str, int]] = {}
+    for m in _ETHTOOL_PACKETS_RE.finditer(output):
+        key, packet_type, val = m.groups()
+        if key == f"{packet_type}_packets":
+            direct[packet_type] = int(val)
+        else:
+            queues.setdefault(packet_type, {})[key] = int(val)
+
+    result = {packet_type: sum(d.values()) for packet_type, d in queues.items()}
+    result.update(direct)
     return result
 
 
-def ethtool_stat_get_packets(data: dict[str, str], packet_type: str) -> Optional[int]:
-
-    # Case1: Try to parse rx_packets and tx_packets from ethtool output
-    val = data.get(f"{packet_type}_packets")
-    if val is not None:
-        try:
-            return int(val)
-        except KeyError:
-            return None
-
-    # Case2: Ethtool output does not provide these fields, so we need to sum
-    # the queues manually.
-    total_packets = 0
-    prefix = f"{packet_type}_queue_"
-    packet_suffix = "_xdp_packets"
-    any_match = False
-
-    for k, v in data.items():
-        if k.startswith(prefix) and k.endswith(packet_suffix):
-            try:
-                total_packets += int(v)
-            except KeyError:
-                return None
-            any_match = True
-    if not any_match:
-        return None
-    return total_packets
-
-
 KEY_NAMES = {
     "start": {
         "rx": "rx_start",
@@ -83,13 +67,13 @@ def ethtool_stat_get_startend(
     ethtool_data: str,
     suffix: typing.Literal["start", "end"],
 ) -> bool:
-    ethtool_dict = ethtool_stat_parse(ethtool_data)
+    packets = ethtool_stat_parse_packets(ethtool_data)
     has_any = False
     for ethtool_name in ("rx", "tx"):
         # Don't construct key_name as f"{ethtool_name}_{suffix}", because the
         # keys should appear verbatim in source code, so we can grep for them.
         key_name = KEY_NAMES[suffix][ethtool_name]
-        v = ethtool_stat_get_packets(ethtool_dict, ethtool_name)
+        v = packets.get(ethtool_name)
         if v is None:
             continue
         parsed_data[key_name] = v
@@ -152,25 +136,20 @@ class TaskValidateOffload(PluginTask):
     ):
         super().__init__(ts, 0, perf_instance.node_name, tenant)
 
-        self.in_file_template = "./manifests/tools-pod.yaml.j2"
-        self.out_file_yaml = (
-            f"./manifests/yamls/tools-pod-{self.node_name}-validate-offload.yaml"
-        )
-        self.pod_name = f"tools-pod-{self.node_name}-validate-offload"
+        self.init_tools_pod()
         self._perf_instance = perf_instance
         self.perf_pod_name = perf_instance.pod_name
         self.perf_pod_type = perf_instance.pod_type
 
-    def get_template_args(self) -> dict[str, str | list[str]]:
-        return {
-            **super().get_template_args(),
-            "pod_name": self.pod_name,
-            "test_image": tftbase.get_tft_test_image(),
-        }
+        # For hostbacked pods and the external server, there is no VF
+        # representor to look up. We don't need the tools pod then.
+        self._needs_tools_pod = (
+            self.perf_pod_type != PodType.HOSTBACKED
+            and self.perf_pod_name != task.EXTERNAL_PERF_SERVER
+        )
 
-    def initialize(self) -> None:
-        super().initialize()
-        self.render_file("Server Pod Yaml")
+    def uses_tools_pod(self) -> bool:
+        return self._needs_tools_pod
 
     def _create_task_operation(self) -> TaskOperation:
         def _thread_action() -> BaseOutput:
@@ -211,48 +190,49 @@ class TaskValidateOffload(PluginTask):
 
             if vf_rep is not None:
                 r1 = self.run_oc_exec(ethtool_cmd)
-
-                self.ts.event_client_finished.wait()
-
-                r2 = self.run_oc_exec(ethtool_cmd)
-
                 parsed_data["ethtool_cmd_1"] = common.dataclass_to_dict(r1)
-                parsed_data["ethtool_cmd_2"] = common.dataclass_to_dict(r2)
-
-                if r1.success:
-                    data1 = r1.out
-                if r2.success:
-                    data2 = r2.out
 
                 if not r1.success:
+                    # Without the start snapshot, the end snapshot is useless.
+                    # Don't wait for the client and don't run ethtool again.
                     success_result = False
                     msg = "ethtool command failed"
-                elif not r2.success:
-                    success_result = False
-                    msg = "ethtool command at end failed"
+                else:
+                    data1 = r1.out
 
-                if not ethtool_stat_get_startend(parsed_data, data1, "start"):
-                    if success_result:
-                        success_result = False
-                        msg = "ethtool output cannot be parsed"
-                if not ethtool_stat_get_startend(parsed_data, data2, "end"):
-                    if success_result:
-                        success_result = False
-                        msg = "ethtool output at end cannot be parsed"
+                    self.ts.event_client_finished.wait()
 
-                logger.info(
-                    f"rx_packet_start: {parsed_data.get('rx_start', 'N/A')}\n"
-                    f"tx_packet_start: {parsed_data.get('tx_start', 'N/A')}\n"
-                    f"rx_packet_end: {parsed_data.get('rx_end', 'N/A')}\n"
-                    f"tx_packet_end: {parsed_data.get('tx_end', 'N/A')}\n"
-                )
+                    r2 = self.run_oc_exec(ethtool_cmd)
+                    parsed_data["ethtool_cmd_2"] = common.dataclass_to_dict(r2)
 
-                if success_result:
-                    m1 = check_no_traffic_on_vf_rep(parsed_data, "rx")
-                    m2 = check_no_traffic_on_vf_rep(parsed_data, "tx")
-                    if m1 is not None or m2 is not None:
+                    if r2.success:
+                        data2 = r2.out
+                    else:
                         success_result = False
-                        msg = m1 if m1 is not None else m2
+                        msg = "ethtool command at end failed"
+
+                    if not ethtool_stat_get_startend(parsed_data, data1, "start"):
+                        if success_result:
+                            success_result = False
+                            msg = "ethtool output cannot be parsed"
+                    if not ethtool_stat_get_startend(parsed_data, data2, "end"):
+                        if success_result:
+                            success_result = False
+                            msg = "ethtool output at end cannot be parsed"
+
+                    logger.info(
+                        f"rx_packet_start: {parsed_data.get('rx_start', 'N/A')}\n"
+                        f"tx_packet_start: {parsed_data.get('tx_start', 'N/A')}\n"
+                        f"rx_packet_end: {parsed_data.get('rx_end', 'N/A')}\n"
+                        f"tx_packet_end: {parsed_data.get('tx_end', 'N/A')}\n"
+                    )
+
+                    if success_result:
+                        m1 = check_no_traffic_on_vf_rep(parsed_data, "rx")
+                        m2 = check_no_traffic_on_vf_rep(parsed_data, "tx")
+                        if m1 is not None or m2 is not None:
+                            success_result = False
+                            msg = m1 if m1 is not None else m2
 
             return PluginOutput(
                 success=success_result,
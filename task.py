@@ -44,6 +44,41 @@ EXTERNAL_PERF_SERVER = "external-perf-server"
 T = TypeVar("T")
 
 
+_vf_rep_cache_lock = threading.Lock()
+
+_vf_rep_cache: dict[tuple[str, str, str], str] = {}
+
+
+def vf_rep_cache_clear(namespace: str) -> None:
+    with _vf_rep_cache_lock:
+        for key in [k for k in _vf_rep_cache if k[0] == namespace]:
+            del _vf_rep_cache[key]
+
+
+_pod_locks_lock = threading.Lock()
+
+_pod_locks: dict[tuple[bool, str, str], threading.RLock] = {}
+
+
+class _ToolsPod:
+    # State of a tools pod that is shared by the plugin tasks on a node.
+    # Protected by the pod lock (Task._get_pod_lock()).
+    def __init__(self) -> None:
+        self.rendered = False
+        self.ready = False
+
+
+_tools_pods_lock = threading.Lock()
+
+_tools_pods: dict[tuple[bool, str, str], _ToolsPod] = {}
+
+
+def tools_pod_cache_clear(namespace: str) -> None:
+    with _tools_pods_lock:
+        for key in [k for k in _tools_pods if k[1] == namespace]:
+            del _tools_pods[key]
+
+
 class _OperationState(enum.Enum):
     NEW = (1,)
     STARTING = (2,)
@@ -351,8 +386,9 @@ class Task(ABC):
             out_file=out_file_yaml,
         )
 
-        rendered_dict = yaml.safe_load(rendered)
-        logger.debug(f'"{in_file_template}" contains: {json.dumps(rendered_dict)}')
+        if logger.isEnabledFor(logging.DEBUG):
+            rendered_dict = yaml.safe_load(rendered)
+            logger.debug(f'"{in_file_template}" contains: {json.dumps(rendered_dict)}')
 
     def initialize(self) -> None:
         pass
@@ -563,20 +599,32 @@ class Task(ABC):
         self._setup_operation = None
         to.finish(timeout=5)
 
+    def _get_pod_lock(self) -> threading.RLock:
+        key = (self.tenant, self.get_namespace(), self.pod_name)
+        with _pod_locks_lock:
+            lock = _pod_locks.get(key)
+            if lock is None:
+                lock = threading.RLock()
+                _pod_locks[key] = lock
+            return lock
+
     def setup_pod(self) -> None:
-        # Check if pod already exists
-        v = self.run_oc_get(f"pod/{self.pod_name}", may_fail=True)
-        if v is None:
-            logger.info(f"Creating Pod {self.pod_name}.")
-            self.run_oc(f"apply -f {self.out_file_yaml}", die_on_error=True)
-        else:
-            logger.info(f"Pod {self.pod_name} already exists.")
+        # Tasks get set up in parallel and some share the same pod. Checking
+        # and creating the pod must not race.
+        with self._get_pod_lock():
+            # Check if pod already exists
+            v = self.run_oc_get(f"pod/{self.pod_name}", may_fail=True)
+            if v is None:
+                logger.info(f"Creating Pod {self.pod_name}.")
+                self.run_oc(f"apply -f {self.out_file_yaml}", die_on_error=True)
+            else:
+                logger.info(f"Pod {self.pod_name} already exists.")
 
-        logger.info(f"Waiting for Pod {self.pod_name} to become ready.")
-        self.run_oc(
-            f"wait --for=condition=ready pod/{self.pod_name} --timeout=10m",
-            die_on_error=True,
-        )
+            logger.info(f"Waiting for Pod {self.pod_name} to become ready.")
+            self.run_oc(
+                f"wait --for=condition=ready pod/{self.pod_name} --timeout=10m",
+                die_on_error=True,
+            )
 
     def start_task(self) -> None:
         assert self._task_operation is None
@@ -668,6 +716,33 @@ class Task(ABC):
         ifname: str,
         host_pod_name: str,
     ) -> Optional[str]:
+        # The VF representor of a pod does not change during the lifetime of
+        # the pod. The forward and reverse run of a test share the same pods,
+        # so remember the result until vf_rep_cache_clear() is called when the
+        # pods get deleted.
+        key = (self.get_namespace(), pod_name, ifname)
+        with _vf_rep_cache_lock:
+            vf_rep = _vf_rep_cache.get(key)
+        if vf_rep is not None:
+            return vf_rep
+
+        vf_rep = self._pod_get_vf_rep(
+            pod_name=pod_name,
+            ifname=ifname,
+            host_pod_name=host_pod_name,
+        )
+        if vf_rep is not None:
+            with _vf_rep_cache_lock:
+                _vf_rep_cache[key] = vf_rep
+        return vf_rep
+
+    def _pod_get_vf_rep(
+        self,
+        *,
+        pod_name: str,
+        ifname: str,
+        host_pod_name: str,
+    ) -> Optional[str]:
 
         lst_1 = self.pod_get_device_infos(pod_name=pod_name, ifname=ifname)
         pciaddr_1: Optional[str] = None
@@ -960,6 +1035,56 @@ class PluginTask(Task, ABC):
     def plugin(self) -> Plugin:
         pass
 
+    def init_tools_pod(self) -> None:
+        # The plugins only "oc exec" into a privileged pod on the node. They
+        # all share the same pod per node, so it only gets created once.
+        self.in_file_template = "./manifests/tools-pod.yaml.j2"
+        self.out_file_yaml = f"./manifests/yamls/tools-pod-{self.node_name}.yaml"
+        self.pod_name = f"tools-pod-{self.node_name}"
+
+    def uses_tools_pod(self) -> bool:
+        return True
+
+    def _get_tools_pod(self) -> _ToolsPod:
+        key = (self.tenant, self.get_namespace(), self.pod_name)
+        with _tools_pods_lock:
+            tools_pod = _tools_pods.get(key)
+            if tools_pod is None:
+                tools_pod = _ToolsPod()
+                _tools_pods[key] = tools_pod
+            return tools_pod
+
+    def get_template_args(self) -> dict[str, str | list[str]]:
+        return {
+            **super().get_template_args(),
+            "pod_name": self.pod_name,
+            "test_image": tftbase.get_tft_test_image(),
+        }
+
+    def initialize(self) -> None:
+        super().initialize()
+        if not self.uses_tools_pod():
+            return
+        tools_pod = self._get_tools_pod()
+        with self._get_pod_lock():
+            if not tools_pod.rendered:
+                self.render_file("Tools Pod Yaml")
+                tools_pod.rendered = True
+
+    def _create_setup_operation(self) -> Optional[TaskOperation]:
+        if not self.uses_tools_pod():
+            return None
+        return super()._create_setup_operation()
+
+    def setup_pod(self) -> None:
+        tools_pod = self._get_tools_pod()
+        with self._get_pod_lock():
+            if tools_pod.ready:
+                logger.info(f"Pod {self.pod_name} is already set up.")
+                return
+            super().setup_pod()
+            tools_pod.ready = True
+
     def get_plugin_metadata(self) -> tftbase.PluginMetadata:
         return tftbase.PluginMetadata(
             plugin_name=self.plugin.PLUGIN_NAME,
@@ -1,12 +1,12 @@
 import abc
 import dataclasses
-import datetime
 import json
 import logging
 import os
 import pathlib
 import shlex
 import threading
+import time
 import typing
 import yaml
 
@@ -464,7 +464,7 @@ class ConfTest(StructParseBaseNamed):
         output_base = self.config.test_config.output_base
 
         if output_base is None:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+            timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
             return self.logs_abspath / f"{timestamp}.json"
 
         path = common.path_norm(
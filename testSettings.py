@@ -37,19 +37,24 @@ class TestSettings:
         self._lock: threading.Lock
         object.__setattr__(self, "_lock", threading.Lock())
 
-        # Check that the cfg_descr has a connection/test_case_id
-        self.connection
-        self.test_case_id
+        # The connection and test case are looked up by index via cfg_descr.
+        # The tasks access them all the time, resolve them only once. This
+        # also checks that the cfg_descr has a connection/test_case_id.
+        self._connection: testConfig.ConfConnection
+        object.__setattr__(self, "_connection", self.cfg_descr.get_connection())
+        self._test_case_id: tftbase.TestCaseType
+        object.__setattr__(self, "_test_case_id", self.cfg_descr.get_test_case())
 
     @property
     def clmo_barrier(self) -> threading.Barrier:
-        with self._lock:
-            b = getattr(self, "_clmo_barrier", None)
-            if b is None:
-                raise RuntimeError(
-                    "Cannot access the client-monitor barrier before calling initialize_clmo_barrier()"
-                )
-            return typing.cast(threading.Barrier, b)
+        # The barrier is only set once by initialize_clmo_barrier() and never
+        # changes afterwards. Reading it does not need to take the lock.
+        b = getattr(self, "_clmo_barrier", None)
+        if b is None:
+            raise RuntimeError(
+                "Cannot access the client-monitor barrier before calling initialize_clmo_barrier()"
+            )
+        return typing.cast(threading.Barrier, b)
 
     def initialize_clmo_barrier(self, parties: int) -> None:
         with self._lock:
@@ -69,11 +74,11 @@ class TestSettings:
 
     @property
     def connection(self) -> testConfig.ConfConnection:
-        return self.cfg_descr.get_connection()
+        return self._connection
 
     @property
     def test_case_id(self) -> tftbase.TestCaseType:
-        return self.cfg_descr.get_test_case()
+        return self._test_case_id
 
     @property
     def server_is_tenant(self) -> bool:
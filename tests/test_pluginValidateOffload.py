@@ -8,8 +8,6 @@ import pluginValidateOffload  # noqa: E402
 
 def test_ethtool_parse_stat() -> None:
 
-    assert pluginValidateOffload.ethtool_stat_parse("") == {}
-
     data = """NIC statistics:
      tx_packets: 2537925
      rx_packets: 5645343
@@ -25,30 +23,12 @@ def test_ethtool_parse_stat() -> None:
      tx_aborted: 0
      tx_underrun: 0
 """
-    expected_d = {
-        "tx_packets": "2537925",
-        "rx_packets": "5645343",
-        "tx_errors": "0",
-        "rx_errors": "0",
-        "rx_missed": "0",
-        "align_errors": "0",
-        "tx_single_collisions": "0",
-        "tx_multi_collisions": "0",
-        "rx_unicast": "5373570",
-        "rx_broadcast": "226191",
-        "rx_multicast": "45582",
-        "tx_aborted": "0",
-        "tx_underrun": "0",
+    assert pluginValidateOffload.ethtool_stat_parse_packets("") == {}
+    assert pluginValidateOffload.ethtool_stat_parse_packets(data) == {
+        "rx": 5645343,
+        "tx": 2537925,
     }
 
-    d = pluginValidateOffload.ethtool_stat_parse(data)
-    assert d == expected_d
-    assert list(d) == list(expected_d)
-
-    assert pluginValidateOffload.ethtool_stat_get_packets(d, "tx") == 2537925
-    assert pluginValidateOffload.ethtool_stat_get_packets(d, "rx") == 5645343
-    assert pluginValidateOffload.ethtool_stat_get_packets(d, "foo") is None
-
     res: dict[str, int] = {}
     assert pluginValidateOffload.ethtool_stat_get_startend(res, data, "start")
     assert res == {
@@ -1877,24 +1857,23 @@ def test_ethtool_parse_stat_2() -> None:
      tx_queue_0_xdp_xmit: 0
      tx_queue_0_xdp_xmit_errors: 0
 """
-    d1_start = pluginValidateOffload.ethtool_stat_parse(data1_start)
-    assert isinstance(d1_start, dict)
-    assert d1_start["rx_queue_61_xdp_bytes"] == "0"
-
-    d2_start = pluginValidateOffload.ethtool_stat_parse(data2_start)
-    assert isinstance(d2_start, dict)
-    assert d2_start["rx_queue_61_xdp_bytes"] == "0"
+    for data in (data1_start, data2_start, data1_end, data2_end):
+        assert pluginValidateOffload.ethtool_stat_parse_packets(data) == {"rx": 7}
 
-    d1_end = pluginValidateOffload.ethtool_stat_parse(data1_end)
-    assert isinstance(d1_end, dict)
-
-    d2_end = pluginValidateOffload.ethtool_stat_parse(data2_end)
-    assert isinstance(d2_end, dict)
+    # The direct counter takes precedence over the queue counters.
+    data = """     rx_queue_0_xdp_packets: 3
+     rx_packets: 5
+     tx_queue_0_xdp_packets: 1
+     tx_queue_a_xdp_packets: 2
+"""
+    assert pluginValidateOffload.ethtool_stat_parse_packets(data) == {"rx": 5, "tx": 3}
 
-    v = pluginValidateOffload.ethtool_stat_get_packets(d1_start, "rx")
-    assert v == 7
-    v = pluginValidateOffload.ethtool_stat_get_packets(d1_start, "tx")
-    assert v is None
+    # A value must be on the same line as its counter.
+    data = """     rx_packets:
+     12
+     tx_packets: 4\r
+"""
+    assert pluginValidateOffload.ethtool_stat_parse_packets(data) == {"tx": 4}
 
     res1: dict[str, int] = {}
     assert pluginValidateOffload.ethtool_stat_get_startend(res1, data1_start, "start")
@@ -1,9 +1,15 @@
 import logging
+import os
+import shutil
 import task
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from ktoolbox import host
+from ktoolbox.k8sClient import K8sClient
 
 import testConfig
 import tftbase
@@ -12,6 +18,7 @@ from evaluator import Evaluator
 from task import Task
 from testConfig import ConfigDescriptor
 from testSettings import TestSettings
+from tftbase import ConnectionMode
 from tftbase import TftResult
 from tftbase import TftResults
 
@@ -20,6 +27,31 @@ logger = logging.getLogger("tft." + __name__)
 
 
 class TrafficFlowTests:
+    def __init__(self) -> None:
+        self._has_mnp_cache: dict[K8sClient, bool] = {}
+
+    def _has_multi_networkpolicies(self, client: K8sClient) -> Optional[bool]:
+        # Whether the cluster knows the multi-networkpolicies resource does
+        # not change during our run. Only probe once, and only cache a
+        # definite answer.
+        has_mnp = self._has_mnp_cache.get(client)
+        if has_mnp is not None:
+            return has_mnp
+        r = client.oc(
+            "api-resources --api-group=k8s.cni.cncf.io -o name",
+            may_fail=True,
+        )
+        # Discovery can fail for unrelated API groups but still print what it
+        # found. Trust a match even if the command failed.
+        has_mnp = any(
+            line.split(".", 1)[0] == "multi-networkpolicies"
+            for line in r.out.splitlines()
+        )
+        if not has_mnp and not r.success:
+            return None
+        self._has_mnp_cache[client] = has_mnp
+        return has_mnp
+
     def _configure_namespace(self, cfg_descr: ConfigDescriptor) -> None:
         namespace = cfg_descr.get_tft().namespace
         logger.info(f"Configuring namespace {namespace}")
@@ -31,29 +63,63 @@ class TrafficFlowTests:
         )
 
     def _cleanup_previous_testspace(self, cfg_descr: ConfigDescriptor) -> None:
-        namespace = cfg_descr.get_tft().namespace
+        tft = cfg_descr.get_tft()
+        namespace = tft.namespace
         client = cfg_descr.tc.client_tenant
-        logger.info(
-            f"Cleaning pods, services and multi-networkpolicies with label tft-tests in namespace {namespace}"
-        )
-        client.oc("delete pods -l tft-tests", namespace=namespace)
-        client.oc("delete services -l tft-tests", namespace=namespace)
-        client.oc(
-            "delete multi-networkpolicies -l tft-tests",
-            namespace=namespace,
-            check_success=client.check_success_delete_ignore_noexist(
-                "multi-networkpolicies"
-            ),
-        )
 
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The external server is a local container and independent of the
+            # cluster resources. Remove it while "oc" is busy. Skip podman
+            # entirely if no test case uses it. Every invocation pays a
+            # noticeable startup cost, and a leftover container does not hurt
+            # (it gets replaced by "podman run --replace").
+            cleanup_external: Optional[Future[None]] = None
+            if self._uses_external_perf_server(tft):
+                cleanup_external = executor.submit(self._cleanup_external_perf_server)
+
+            logger.info(
+                f"Cleaning pods, services and multi-networkpolicies with label tft-tests in namespace {namespace}"
+            )
+            has_mnp = self._has_multi_networkpolicies(client)
+            if has_mnp:
+                client.oc(
+                    "delete pods,services,multi-networkpolicies -l tft-tests",
+                    namespace=namespace,
+                )
+            else:
+                client.oc("delete pods,services -l tft-tests", namespace=namespace)
+            if has_mnp is None:
+                # We don't know whether the CRD exists. Try separately and
+                # ignore the failure if it doesn't.
+                client.oc(
+                    "delete multi-networkpolicies -l tft-tests",
+                    namespace=namespace,
+                    check_success=client.check_success_delete_ignore_noexist(
+                        "multi-networkpolicies"
+                    ),
+                )
+            task.vf_rep_cache_clear(namespace)
+            task.tools_pod_cache_clear(namespace)
+
+            if cleanup_external is not None:
+                cleanup_external.result()
+
+    def _cleanup_external_perf_server(self) -> None:
         logger.info(
             f"Cleaning external containers {task.EXTERNAL_PERF_SERVER} (if present)"
         )
         host.local.run(
-            f"podman rm --force --time 10 {task.EXTERNAL_PERF_SERVER}",
+            f"podman rm --force --time 0 {task.EXTERNAL_PERF_SERVER}",
             log_level_fail=logging.WARN,
         )
 
+    def _uses_external_perf_server(self, tft: testConfig.ConfTest) -> bool:
+        return any(
+            tftbase.test_case_type_to_connection_mode(test_case_id)
+            == ConnectionMode.EXTERNAL_IP
+            for test_case_id in tft.test_cases
+        )
+
     def _create_log_paths_from_tests(self, test: testConfig.ConfTest) -> Path:
         log_file = test.get_output_file()
         log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -96,30 +162,36 @@ class TrafficFlowTests:
             )
             monitors.extend(m)
 
-        for t in servers + clients + monitors:
+        all_tasks = (*servers, *clients, *monitors)
+
+        for t in all_tasks:
             t.initialize()
 
         ts.initialize_clmo_barrier(len(clients) + len(monitors))
 
-        for tasks in servers + clients + monitors:
-            tasks.start_setup()
+        # Setting up is dominated by waiting for the pods to become ready. Do
+        # that in parallel. Tasks can share a pod (the plugins' tools pod),
+        # Task.setup_pod() serializes the setup of the same pod. The other
+        # phases stay sequential to keep the order of results deterministic.
+        with ThreadPoolExecutor(max_workers=len(all_tasks)) as executor:
+            list(executor.map(lambda t: t.start_setup(), all_tasks))
 
         ts.event_server_alive.wait()
 
-        for tasks in servers + clients + monitors:
+        for tasks in all_tasks:
             tasks.start_task()
 
         ts.event_client_finished.wait()
 
-        for tasks in servers + clients + monitors:
+        for tasks in all_tasks:
             tasks.finish_task()
 
-        for tasks in servers + clients + monitors:
+        for tasks in all_tasks:
             tasks.finish_setup()
 
         tft_result_builder = tftbase.TftResultBuilder()
 
-        for tasks in servers + clients + monitors:
+        for tasks in all_tasks:
             tasks.aggregate_output(tft_result_builder)
 
         return tft_result_builder.build()
@@ -131,6 +203,7 @@ class TrafficFlowTests:
             connection = cfg_descr2.get_connection()
             logger.info(f"Starting {connection.name}")
             logger.info(f"Number Of Simultaneous connections {connection.instances}")
+            can_run_reverse = connection.test_type_handler.can_run_reverse()
             for instance_index in range(connection.instances):
                 tft_results.append(
                     self._run_test_case_instance(
@@ -138,7 +211,7 @@ class TrafficFlowTests:
                         instance_index=instance_index,
                     )
                 )
-                if connection.test_type_handler.can_run_reverse():
+                if can_run_reverse:
                     tft_results.append(
                         self._run_test_case_instance(
                             cfg_descr2,
@@ -161,8 +234,14 @@ class TrafficFlowTests:
         evaluator: Evaluator,
     ) -> None:
         test = cfg_descr.get_tft()
-        self._configure_namespace(cfg_descr)
-        self._cleanup_previous_testspace(cfg_descr)
+
+        # Labeling the namespace and deleting the leftovers of a previous run
+        # are independent of each other. The cleanup is dominated by waiting
+        # for pods to terminate, so run it in the background.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cleanup = executor.submit(self._cleanup_previous_testspace, cfg_descr)
+            self._configure_namespace(cfg_descr)
+            cleanup.result()
 
         logger.info(f"Running test {test.name} for {test.duration} seconds")
         tft_results = self._run_test_cases(cfg_descr)
@@ -178,10 +257,14 @@ class TrafficFlowTests:
         logger.info(f"Write results to {log_file}")
         tft_results.serialize_to_file(log_file)
         # For backward compatiblity, still write the "-RESULTS" file. It's
-        # mostly useless now as it's identical to the main file.
-        tft_results.serialize_to_file(
-            log_file.parent / (str(log_file.stem) + "-RESULTS")
-        )
+        # mostly useless now as it's identical to the main file, so hardlink
+        # it instead of serializing the results again.
+        results_file = log_file.with_name(log_file.stem + "-RESULTS")
+        results_file.unlink(missing_ok=True)
+        try:
+            os.link(log_file, results_file)
+        except OSError:
+            shutil.copyfile(log_file, results_file)
 
         if not result_status.result:
-            logger.error(f"Failure detected in {cfg_descr.get_tft().name} results")
+            logger.error(f"Failure detected in {test.name} results")